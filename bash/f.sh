@@ -13,6 +13,9 @@ _fast_history_hooked_cmd=""
 _fast_history_short_cmd=false
 # [sperimental feature, off by default] if true the return code of the executed command is check before to store it
 _fast_history_check_return_code=false
+# [sperimental feature, off by default] if true the hooked commands are appended to a spool file and stored in background
+# the prompt does not wait for the database
+_fast_history_async_capture=false
 
 # define internal log function 
 _fast_history_log() {
@@ -57,11 +60,30 @@ else
 	_fast_history_log "debug" "preexec loaded correctly";
 fi
 
+# socket of the (optional) search server, see "f-server"
+_fast_history_socket_file="$_fast_history_project_directory"data/fh_server.sock
+# spool of the commands captured asynchronously, see "_fast_history_async_capture"
+_fast_history_spool_file="$_fast_history_project_directory"data/fh_spool
+
+# call the fastHistory in SEARCH mode
+# if the search server is running the request is sent to it, otherwise a new python process is started
+_fast_history_search() {
+    if [ -S "$_fast_history_socket_file" ]; then
+        python3 "$_fast_history_project_directory"fastHistory/fastHistoryClient.py "search" "$1";
+        # return code 2: the server is not reachable, fall back to the one-shot mode
+        if [ $? -ne 2 ]; then
+            return;
+        fi
+        _fast_history_log "debug" "search server not available";
+    fi
+    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "search" "$1";
+}
+
 # define custom function to call the fastHistory in SEARCH mode
 f-search() {
     # trick to capture all input (otherwise the comments are removed)
     arguments=${_fast_history_hooked_cmd:8 + 1}
-    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "search" "$arguments";
+    _fast_history_search "$arguments";
     unset _fast_history_hooked_cmd;
     }
 
@@ -69,10 +91,15 @@ f-search() {
 f() {
     # trick to capture all input (otherwise the comments are removed)
     arguments=${_fast_history_hooked_cmd:1 + 1}
-    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "search" "$arguments";
+    _fast_history_search "$arguments";
     unset _fast_history_hooked_cmd;
 }
 
+# define function to start, stop or check the search server (it keeps fastHistory loaded to speed up the searches)
+f-server() {
+    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "server" "${1:-status}";
+}
+
 # define function to add a command to fastHistory without execute it
 f-add() {
     # trick to capture all input (otherwise the comments are removed)
@@ -92,15 +119,24 @@ f-import(){
 }
 
 # define function to export db
+# --compact: smaller output (e.g. to move it to another machine), --tagged: only the tagged commands (compact)
 f-export(){
+    local mode="export"
+    if [ "$1" = "--compact" ] || [ "$1" = "-c" ]; then
+        mode="export-compact"
+        shift
+    elif [ "$1" = "--tagged" ] || [ "$1" = "-t" ]; then
+        mode="export-tagged"
+        shift
+    fi
     if [ $# -eq 0 ]; then
-    	python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "export" "fastHistory_$(date +'%Y-%m-%d').db";
+    	python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "$mode" "fastHistory_$(date +'%Y-%m-%d').db";
     else
     	DIR=$1
     	if [ "${DIR:0:1}" = "/" ]; then
-    	    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "export" "$1";
+    	    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "$mode" "$1";
     	else
-    	    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "export" "$(pwd)/$1";
+    	    python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "$mode" "$(pwd)/$1";
     	fi
     fi
 }
@@ -120,7 +156,13 @@ precmd() {
 		    	# this is just a preliminary check, in the python module a strict regex will be used
 		    	# this is only done to avoid to load the python module for each command
 		    	if [[ "$_fast_history_hooked_cmd" = *"#"* ]]; then
-				python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "add" "$_fast_history_hooked_cmd"
+				if $_fast_history_async_capture; then
+					# the command is appended to the spool (NUL terminated) and stored by a background process
+					printf '%s\0' "$_fast_history_hooked_cmd" >> "$_fast_history_spool_file";
+					( python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "ingest" "" > /dev/null 2>&1 & )
+				else
+					python3 "$_fast_history_project_directory"fastHistory/fastHistory.py "add" "$_fast_history_hooked_cmd"
+				fi;
 				# clean the cmd, this is needed because precmd can be trigged without preexec (example ctrl+c)
 				unset _fast_history_hooked_cmd;
 			else	